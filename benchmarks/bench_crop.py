@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the crop stage of OBJSpinner cache builds.
+
+Renders frames once, then times turning them into cropped frame strings.
+The legacy post-pass scans every cell of every buffer (compute_bbox_union),
+then crops and joins. The fused path uses extents tracked while
+rasterizing (crop_entry + assemble_frames). Render time is shown for scale.
+
+Usage:
+  python benchmarks/bench_crop.py                          # built-in Lambda, 144 frames
+  python benchmarks/bench_crop.py model.obj --frames 288 --size 200x60 --mode solid
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from termarcade.objspin import (  # noqa: E402
+    MODES,
+    OBJSpinner,
+    assemble_frames,
+    crop_entry,
+    load_obj_mesh,
+    normalize,
+)
+
+
+# Reference implementation: the scan-crop-join post-pass used before extents
+# were tracked during rasterization.
+def buffer_to_string(buf):
+    return "\n".join("".join(row) for row in buf)
+
+
+def compute_bbox_union(buffers):
+    min_r = min_c = 10**9
+    max_r = max_c = -10**9
+    for buf in buffers:
+        h = len(buf)
+        w = len(buf[0]) if h else 0
+        for r in range(h):
+            row = buf[r]
+            for c in range(w):
+                if row[c] != " ":
+                    if r < min_r:
+                        min_r = r
+                    if r > max_r:
+                        max_r = r
+                    if c < min_c:
+                        min_c = c
+                    if c > max_c:
+                        max_c = c
+    if max_r < min_r or max_c < min_c:
+        return (0, 0, 0, 0)
+    return (min_r, max_r, min_c, max_c)
+
+
+def crop(buf, bbox):
+    a, b, c, d = bbox
+    return [row[c : d + 1] for row in buf[a : b + 1]]
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the frame crop stage.")
+    parser.add_argument("obj", nargs="?", help="OBJ model (default: built-in Lambda)")
+    parser.add_argument("--frames", type=int, default=144)
+    parser.add_argument("--size", default="120x36", help="COLSxROWS")
+    parser.add_argument("--mode", choices=MODES, default="wireframe")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    cols, rows = (int(v) for v in args.size.lower().split("x"))
+
+    spinner = OBJSpinner(obj_path=args.obj, frames=args.frames, mode=args.mode)
+    verts, edges, tris, lines = load_obj_mesh(spinner.obj_path)
+    solid = args.mode == "solid"
+    mesh = (normalize(verts), edges, tris if solid else None, lines if solid else None)
+
+    start = time.perf_counter()
+    rendered = [spinner._render_buffer(spinner._pose(i), (cols, rows), *mesh)
+                for i in range(args.frames)]
+    render_s = time.perf_counter() - start
+    bufs = [buf for buf, _ in rendered]
+
+    def legacy():
+        bbox = compute_bbox_union(bufs)
+        frames = [buffer_to_string(crop(b, bbox)) for b in bufs]
+        width = len(frames[0].split("\n")[0]) if frames else 0
+        height = len(frames[0].split("\n")) if frames else 0
+        return frames, width, height
+
+    def fused():
+        return assemble_frames([crop_entry(buf, bbox) for buf, bbox in rendered])
+
+    if legacy()[0] != fused()[0]:
+        print("WARNING: legacy and fused outputs differ")
+    legacy_s = best_of(legacy, args.repeat)
+    fused_s = best_of(fused, args.repeat)
+
+    print(f"{args.frames} frames at {cols}x{rows}, mode={args.mode}")
+    print(f"render          {render_s * 1000:9.2f} ms")
+    print(f"crop (legacy)   {legacy_s * 1000:9.2f} ms  ({legacy_s / render_s:6.1%} of render)")
+    print(f"crop (fused)    {fused_s * 1000:9.2f} ms  ({fused_s / render_s:6.1%} of render)")
+    print(f"speedup         {legacy_s / fused_s:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
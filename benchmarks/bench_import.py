@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the termarcade package.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters and
+reports the cumulative cost of the package import plus the heaviest modules
+it pulled in.
+
+Usage:
+  python benchmarks/bench_import.py                      # import termarcade
+  python benchmarks/bench_import.py --module termarcade.objspin
+  python benchmarks/bench_import.py --max-us 2000        # exit 1 on regression
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def import_times(module):
+    """Return [(self_us, cumulative_us, name)] for one fresh import of `module`."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure termarcade import time.")
+    parser.add_argument("--module", default="termarcade")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=8, help="heaviest imports to list")
+    parser.add_argument("--max-us", type=int, help="fail if the median exceeds this")
+    args = parser.parse_args()
+
+    totals = []
+    rows = []
+    for _ in range(args.runs):
+        rows = import_times(args.module)
+        own = [r for r in rows if r[2].strip() == args.module]
+        totals.append(own[-1][1] if own else 0)
+    totals.sort()
+    median = totals[len(totals) // 2]
+
+    print(f"import {args.module}: median {median} us, best {totals[0]} us over {args.runs} runs")
+    # Everything listed after the stdlib bootstrap up to the package itself
+    # was imported on its behalf.
+    names = [r[2].strip() for r in rows]
+    start = 0
+    for i, name in enumerate(names):
+        if name == "site":
+            start = i + 1
+    pulled = sorted(rows[start:], key=lambda r: -r[0])[: args.top]
+    print("heaviest modules (self us):")
+    for self_us, _, name in pulled:
+        print(f"  {self_us:>8}  {name.strip()}")
+
+    if args.max_us is not None and median > args.max_us:
+        print(f"FAIL: median {median} us exceeds --max-us {args.max_us}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the headless Snake simulator.
+
+Usage:
+  python benchmarks/bench_snakesim.py                       # 1024 games x 500 ticks
+  python benchmarks/bench_snakesim.py --games 4096 --ticks 200
+  python benchmarks/bench_snakesim.py --record best.json    # save the best game
+  python examples/snake/snake.py --replay best.json         # ...and watch it
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples", "snake"))
+from snakesim import SnakeBatch, save_episode  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=1024)
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--grid", type=int, nargs=2, default=(40, 20), metavar=("W", "H"))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--record", metavar="PATH", help="write the best episode as JSON")
+    args = parser.parse_args()
+
+    sim = SnakeBatch(args.games, args.grid[0], args.grid[1], seed=args.seed,
+                     auto_reset=True, record=bool(args.record))
+    agent = random.Random(args.seed)
+    # Pre-draw actions so the timing measures the simulator, not the agent.
+    plan = [bytes(agent.choices(range(5), weights=(6, 1, 1, 1, 1), k=args.games))
+            for _ in range(min(args.ticks, 64))]
+
+    finished = 0
+    start = time.perf_counter()
+    for t in range(args.ticks):
+        _, _, dones = sim.step(plan[t % len(plan)])
+        finished += sum(dones)
+    elapsed = time.perf_counter() - start
+
+    steps = args.games * args.ticks
+    print(f"games={args.games} ticks={args.ticks} grid={args.grid[0]}x{args.grid[1]}")
+    print(f"elapsed={elapsed:.3f}s  steps/s={steps / elapsed:,.0f}  "
+          f"games finished/s={finished / elapsed:,.0f}")
+
+    if args.record:
+        episodes = sim.finished_episodes() or [sim.episode(0)]
+        best = max(episodes, key=lambda e: (e["score"], len(e["actions"])))
+        save_episode(best, args.record)
+        print(f"recorded game {best['game']} episode {best['episode']} "
+              f"(score {best['score']}) -> {args.record}")
+
+
+if __name__ == "__main__":
+    main()
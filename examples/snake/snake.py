@@ -2,12 +2,21 @@
 """
 Snake demo using termarcade.
 Choose difficulty and play a simple terminal Snake.
+
+Game rules live in snakesim.py; this file is only the terminal front-end.
+
+Usage:
+  python examples/snake/snake.py                      # play
+  python examples/snake/snake.py --replay game.json   # replay a simulated game
 """
-import random
+import random, sys
 from termarcade.app import TerminalApp, MenuWidget, Context
 from termarcade.input import Keys
+from snakesim import SnakeBatch, load_episode, replay, NOOP, UP, DOWN, LEFT, RIGHT
 
-def run():
+KEY_ACTIONS = {Keys.UP:UP, Keys.DOWN:DOWN, Keys.LEFT:LEFT, Keys.RIGHT:RIGHT}
+
+def run(replay_record=None):
     app = TerminalApp(title="Arcade")
     state = {
         "screen":"choose_game",
@@ -21,14 +30,13 @@ def run():
     def snake_reset(ctx: Context):
         w,h = ctx.width, ctx.height
         gw = max(20, min(60, w-4)); gh = max(12, min(24, h-6))
-        cx, cy = gw//2, gh//2
-        s={"grid_w":gw,"grid_h":gh,"dir":(1,0),
-           "body":[(cx-2,cy),(cx-1,cy),(cx,cy)],"grow":0,
-           "food":None,"accum":0.0,"alive":True,"score":0}
-        def spawn():
-            allc=[(x,y) for y in range(s["grid_h"]) for x in range(s["grid_w"])]
-            occ=set(s["body"]); free=[p for p in allc if p not in occ]; return random.choice(free) if free else (0,0)
-        s["food"]=spawn(); s["spawn"]=spawn; state["snake"]=s
+        sim = SnakeBatch(1, gw, gh, seed=random.randrange(2**31))
+        state["snake"]={"sim":sim,"view":sim.snapshot(0),"action":NOOP,"accum":0.0}
+
+    def replay_start(record):
+        state["snake"]={"frames":replay(record),"view":None,"accum":0.0,"done":False}
+        state["snake"]["view"]=next(state["snake"]["frames"])
+        state["screen"]="replay"
 
     def on_key(ctx: Context, key: str):
         scr=state["screen"]
@@ -49,30 +57,27 @@ def run():
                     state["difficulty"]=c; snake_reset(ctx); state["screen"]="snake"
         elif scr=="snake":
             s=state["snake"]; 
-            if not s or not s["alive"]:
+            if not s or not s["view"]["alive"]:
                 if key in (Keys.ENTER, 'q','Q'): state["screen"]="choose_game"; return
             if key in ('q','Q'): state["screen"]="choose_game"; return
-            dx,dy = s["dir"]
-            if key==Keys.LEFT and dx!=1: s["dir"]=(-1,0)
-            if key==Keys.RIGHT and dx!=-1: s["dir"]=(1,0)
-            if key==Keys.UP and dy!=1: s["dir"]=(0,-1)
-            if key==Keys.DOWN and dy!=-1: s["dir"]=(0,1)
+            if key in KEY_ACTIONS: s["action"]=KEY_ACTIONS[key]
+        elif scr=="replay":
+            if key in (Keys.ENTER, 'q','Q'): state["screen"]="choose_game"
 
     def on_update(ctx: Context, dt: float):
-        if state["screen"]!="snake": return
+        if state["screen"] not in ("snake","replay"): return
         s=state["snake"]; 
-        if not s or not s["alive"]: return
+        if not s or not s["view"]["alive"] or s.get("done"): return
         tps=state["speed_map"][state["difficulty"]]; s["accum"]+=dt; step=1.0/tps
         while s["accum"]>=step:
             s["accum"]-=step
-            (dx,dy)=s["dir"]; hx,hy=s["body"][-1]; nx,ny=hx+dx, hy+dy
-            if nx<0 or nx>=s["grid_w"] or ny<0 or ny>=s["grid_h"] or (nx,ny) in s["body"]:
-                s["alive"]=False; break
-            s["body"].append((nx,ny))
-            if (nx,ny)==s["food"]:
-                s["score"]+=1; s["grow"]+=2; s["food"]=s["spawn"]()
-            if s["grow"]>0: s["grow"]-=1
-            else: s["body"].pop(0)
+            if "sim" in s:
+                s["sim"].step((s["action"],)); s["view"]=s["sim"].snapshot(0)
+            else:
+                view=next(s["frames"], None)
+                if view is None: s["done"]=True; break
+                s["view"]=view
+            if not s["view"]["alive"]: break
 
     def on_render(ctx: Context, write):
         write("Arcade — Snake")
@@ -85,26 +90,35 @@ def run():
             write("Choose difficulty:"); write(f"Current game: Snake Classic")
             write("")
             for line in menu_diff.render_lines(ctx.width): write(line)
-        elif state["screen"]=="snake":
+        elif state["screen"] in ("snake","replay"):
             s=state["snake"]; 
             if not s: write("Initializing…"); return
-            gw,gh=s["grid_w"], s["grid_h"]; left=max(0,(ctx.width-(gw+2))//2); pad=" "*left
-            info=f"Difficulty: {state['difficulty']}   Score: {s['score']}"; write(info); write("")
+            v=s["view"]; gw,gh=v["grid_w"], v["grid_h"]; left=max(0,(ctx.width-(gw+2))//2); pad=" "*left
+            mode="Replay" if state["screen"]=="replay" else f"Difficulty: {state['difficulty']}"
+            info=f"{mode}   Score: {v['score']}"; write(info); write("")
             write(pad+"+"+"-"*gw+"+")
-            snake_set=set(s["body"]); food=s["food"]
+            snake_set=set(v["body"]); food=v["food"]; head=v["body"][-1]
             for y in range(gh):
                 row=["|"]
                 for x in range(gw):
-                    if (x,y)==s["body"][-1]: row.append("@")
+                    if (x,y)==head: row.append("@")
                     elif (x,y) in snake_set: row.append("o")
                     elif (x,y)==food: row.append("*")
                     else: row.append(" ")
                 row.append("|"); write(pad+"".join(row))
             write(pad+"+"+"-"*gw+"+")
-            if s["alive"]: write("Use arrows. Q to quit to menu.")
+            if state["screen"]=="replay":
+                write("Replay finished. Enter to return." if not v["alive"] or s["done"] else "Replaying… Enter to stop.")
+            elif v["alive"]: write("Use arrows. Q to quit to menu.")
             else: write("Game Over! Enter to return.")
 
+    if replay_record is not None: replay_start(replay_record)
     app.run(state={}, menu=menu_game, on_key=on_key, on_render=on_render, on_update=on_update, fps=30)
 
 if __name__ == "__main__":
-    run()
+    args=[a for a in sys.argv[1:] if a]
+    if args and args[0]=="--replay":
+        if len(args)<2: print("Usage: snake.py --replay game.json"); sys.exit(2)
+        run(replay_record=load_episode(args[1]))
+    else:
+        run()
@@ -0,0 +1,274 @@
+"""
+Headless, batched Snake simulator.
+
+Steps N independent games in lock-step without touching the terminal. The
+rules match the interactive demo in snake.py (3-cell start facing right,
++2 growth per food, walls and the snake's own body are fatal).
+
+State is stored as flat structure-of-arrays buffers (`array.array` and
+`bytearray`), one slot per game. They support the buffer protocol, so agents
+that use NumPy can view them without copying, e.g.
+``numpy.frombuffer(batch.head, dtype=numpy.int32)``.
+
+Every game owns a `random.Random` seeded from (seed, game index, episode), so
+any episode can be replayed exactly from its seed and recorded actions.
+"""
+import json
+import random
+from array import array
+
+NOOP, UP, DOWN, LEFT, RIGHT = range(5)
+ACTION_DIRS = {UP: (0, -1), DOWN: (0, 1), LEFT: (-1, 0), RIGHT: (1, 0)}
+OBS_SIZE = 7  # head_x, head_y, dir_x, dir_y, food_x, food_y, length
+REWARD_FOOD = 1.0
+REWARD_DEATH = -1.0
+
+
+def episode_seed(seed: int, game: int, episode: int) -> int:
+    return (seed * 1_000_003 + game) * 65_537 + episode
+
+
+class SnakeBatch:
+    """
+    SnakeBatch
+    ----------
+    Run `n` Snake games on a `grid_w` x `grid_h` board in lock-step.
+    - Call step(actions) with one action (NOOP/UP/DOWN/LEFT/RIGHT) per game.
+    - Finished games stay frozen until reset() or auto_reset=True.
+    - With record=True, episode(i) returns everything needed to replay game i.
+    - `first_game` offsets game indices so several batches (e.g. one per
+      process) can shard one seed without overlapping games.
+    """
+
+    def __init__(self, n: int, grid_w: int = 40, grid_h: int = 20, seed: int = 0,
+                 auto_reset: bool = False, record: bool = False, first_game: int = 0):
+        if not isinstance(n, int) or n <= 0:
+            raise ValueError("n must be a positive integer")
+        if grid_w < 4 or grid_h < 1:
+            raise ValueError("grid must be at least 4x1")
+        self.n = n
+        self.grid_w = grid_w
+        self.grid_h = grid_h
+        self.seed = seed
+        self.first_game = first_game
+        self.auto_reset = auto_reset
+        self.record = record
+        self.cells = grid_w * grid_h
+        self.cap = self.cells + 1
+        # Body ring buffers: cell indices (y * grid_w + x), `cap` slots per game.
+        self.body = array("i", bytes(4 * n * self.cap))
+        self.head = array("i", bytes(4 * n))      # ring slot of the head
+        self.length = array("i", bytes(4 * n))
+        self.grow = array("i", bytes(4 * n))
+        self.dir_x = array("i", bytes(4 * n))
+        self.dir_y = array("i", bytes(4 * n))
+        self.food = array("i", bytes(4 * n))      # cell index, -1 when board is full
+        self.score = array("i", bytes(4 * n))
+        self.steps = array("i", bytes(4 * n))
+        self.episodes = array("i", bytes(4 * n))
+        self.alive = bytearray(n)
+        self.occupied = bytearray(n * self.cells)
+        self.rewards = array("f", bytes(4 * n))
+        self.dones = bytearray(n)
+        self.obs = array("i", bytes(4 * n * OBS_SIZE))
+        self._rngs = [None] * n
+        self._actions = [bytearray() for _ in range(n)] if record else None
+        self._finished = []
+        for i in range(n):
+            self._reset_game(i)
+
+    # ------------------------------------------------------------------ reset
+    def reset(self, games=None):
+        """Start a fresh episode for `games` (all games when None)."""
+        for i in range(self.n) if games is None else games:
+            self.episodes[i] += 1
+            self._reset_game(i)
+        return self.observe()
+
+    def _reset_game(self, i):
+        gw = self.grid_w
+        base = i * self.cells
+        self.occupied[base : base + self.cells] = bytes(self.cells)
+        cx, cy = gw // 2, self.grid_h // 2
+        ring = i * self.cap
+        for k, x in enumerate((cx - 2, cx - 1, cx)):
+            cell = cy * gw + x
+            self.body[ring + k] = cell
+            self.occupied[base + cell] = 1
+        self.head[i] = 2
+        self.length[i] = 3
+        self.grow[i] = 0
+        self.dir_x[i], self.dir_y[i] = 1, 0
+        self.score[i] = 0
+        self.steps[i] = 0
+        self.alive[i] = 1
+        game = self.first_game + i
+        self._rngs[i] = random.Random(episode_seed(self.seed, game, self.episodes[i]))
+        if self.record:
+            self._actions[i] = bytearray()
+        self.food[i] = self._spawn(i)
+
+    def _spawn(self, i):
+        rng = self._rngs[i]
+        base = i * self.cells
+        occ = self.occupied
+        for _ in range(32):
+            cell = rng.randrange(self.cells)
+            if not occ[base + cell]:
+                return cell
+        free = [c for c in range(self.cells) if not occ[base + c]]
+        return rng.choice(free) if free else -1
+
+    # ------------------------------------------------------------------- step
+    def step(self, actions):
+        """
+        Advance every live game by one tick.
+
+        Returns (obs, rewards, dones): `obs` is a flat int32 array of
+        n * OBS_SIZE values, `rewards` a float32 array, `dones` a bytearray
+        flagging games that ended on this tick.
+
+        The three buffers are owned by the batch and overwritten in place by
+        the next step()/observe()/reset(); copy them (e.g. `array("i", obs)`,
+        `bytes(dones)`) if you keep them across ticks.
+        """
+        if len(actions) != self.n:
+            raise ValueError(f"expected {self.n} actions, got {len(actions)}")
+        gw, gh, cells, cap = self.grid_w, self.grid_h, self.cells, self.cap
+        body, head, length, grow = self.body, self.head, self.length, self.grow
+        dir_x, dir_y, food, occ = self.dir_x, self.dir_y, self.food, self.occupied
+        alive, rewards, dones = self.alive, self.rewards, self.dones
+        record = self.record
+        for i in range(self.n):
+            rewards[i] = 0.0
+            dones[i] = 0
+            if not alive[i]:
+                continue
+            a = actions[i]
+            if record:
+                self._actions[i].append(a)
+            if a:
+                dx, dy = ACTION_DIRS[a]
+                if dx != -dir_x[i] or dy != -dir_y[i]:
+                    dir_x[i], dir_y[i] = dx, dy
+            self.steps[i] += 1
+            ring = i * cap
+            base = i * cells
+            hcell = body[ring + head[i]]
+            nx = hcell % gw + dir_x[i]
+            ny = hcell // gw + dir_y[i]
+            ncell = ny * gw + nx
+            if nx < 0 or nx >= gw or ny < 0 or ny >= gh or occ[base + ncell]:
+                alive[i] = 0
+                dones[i] = 1
+                rewards[i] = REWARD_DEATH
+                continue
+            h = head[i] + 1
+            if h == cap:
+                h = 0
+            head[i] = h
+            body[ring + h] = ncell
+            occ[base + ncell] = 1
+            length[i] += 1
+            if ncell == food[i]:
+                self.score[i] += 1
+                grow[i] += 2
+                rewards[i] = REWARD_FOOD
+                food[i] = self._spawn(i)
+                if food[i] < 0:
+                    alive[i] = 0
+                    dones[i] = 1
+            if grow[i] > 0:
+                grow[i] -= 1
+            else:
+                tail = h - length[i] + 1
+                if tail < 0:
+                    tail += cap
+                occ[base + body[ring + tail]] = 0
+                length[i] -= 1
+        if self.auto_reset:
+            for i in range(self.n):
+                if dones[i]:
+                    if record:
+                        self._finished.append(self.episode(i))
+                    self.episodes[i] += 1
+                    self._reset_game(i)
+        return self.observe(), rewards, dones
+
+    # ------------------------------------------------------------ observation
+    def observe(self):
+        """Refresh and return the shared observation buffer (see step())."""
+        gw, cap, obs = self.grid_w, self.cap, self.obs
+        for i in range(self.n):
+            o = i * OBS_SIZE
+            hcell = self.body[i * cap + self.head[i]]
+            f = self.food[i]
+            obs[o] = hcell % gw
+            obs[o + 1] = hcell // gw
+            obs[o + 2] = self.dir_x[i]
+            obs[o + 3] = self.dir_y[i]
+            obs[o + 4] = f % gw if f >= 0 else -1
+            obs[o + 5] = f // gw if f >= 0 else -1
+            obs[o + 6] = self.length[i]
+        return obs
+
+    def snapshot(self, i):
+        """Return game `i` in the dict shape the terminal front-end renders."""
+        gw, cap = self.grid_w, self.cap
+        ring = i * cap
+        h, n = self.head[i], self.length[i]
+        cells = [self.body[ring + (h - k) % cap] for k in range(n - 1, -1, -1)]
+        f = self.food[i]
+        return {
+            "grid_w": gw,
+            "grid_h": self.grid_h,
+            "body": [(c % gw, c // gw) for c in cells],
+            "food": (f % gw, f // gw) if f >= 0 else None,
+            "alive": bool(self.alive[i]),
+            "score": self.score[i],
+        }
+
+    # ----------------------------------------------------------------- replay
+    def episode(self, i):
+        """Return the replay record (grid, seed, actions) of game `i`'s current episode."""
+        if not self.record:
+            raise RuntimeError("SnakeBatch was created with record=False")
+        return {
+            "grid_w": self.grid_w,
+            "grid_h": self.grid_h,
+            "seed": self.seed,
+            "game": self.first_game + i,
+            "episode": self.episodes[i],
+            "actions": list(self._actions[i]),
+            "score": self.score[i],
+        }
+
+    def finished_episodes(self):
+        """Return and clear replay records of episodes ended by auto_reset."""
+        done, self._finished = self._finished, []
+        return done
+
+
+def replay(record):
+    """Yield a snapshot after reset and after every recorded action."""
+    sim = SnakeBatch(1, record["grid_w"], record["grid_h"], seed=record["seed"],
+                     first_game=record["game"])
+    if record["episode"]:
+        sim.episodes[0] = record["episode"]
+        sim._reset_game(0)
+    yield sim.snapshot(0)
+    for a in record["actions"]:
+        sim.step((a,))
+        yield sim.snapshot(0)
+        if not sim.alive[0]:
+            break
+
+
+def save_episode(record, path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(record, handle)
+
+
+def load_episode(path):
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
@@ -6,28 +6,68 @@ Usage:
   python scripts/launcher.py                         # default lambda
   python scripts/launcher.py path/to/model.obj       # custom OBJ
   python scripts/launcher.py --rebuild path/to.obj   # force rebuild then play
+  python scripts/launcher.py --solid path/to.obj     # shaded faces instead of edges
 """
-import sys, os
+import sys, os, threading, time
 from termarcade.app import TerminalApp, MenuWidget
-from termarcade.objspin import OBJSpinner
+from termarcade.objspin import OBJSpinner, BuildCancelled
+
+class CacheBuilder:
+    """Run OBJSpinner cache builds on a background thread with progress."""
+    def __init__(self, spinner):
+        self.spinner = spinner
+        self.thread = None; self.cancel = threading.Event()
+        self.done = 0; self.total = 0; self.started = 0.0
+        self.result = None; self.message = ""
+    def running(self): return self.thread is not None and self.thread.is_alive()
+    def start(self, force=True):
+        if self.running(): return
+        self.cancel = threading.Event(); self.done = 0; self.total = self.spinner.frames
+        self.started = time.perf_counter(); self.message = ""
+        self.thread = threading.Thread(target=self._work, args=(self.cancel, force), daemon=True)
+        self.thread.start()
+    def stop(self, wait=False):
+        self.cancel.set()
+        if wait and self.thread is not None: self.thread.join()
+    def _progress(self, done, total): self.done, self.total = done, total
+    def _work(self, cancel, force):
+        try:
+            data = self.spinner.build_if_needed(force=force, progress=self._progress, cancel=cancel)
+        except BuildCancelled:
+            self.message = "Rebuild cancelled."
+        except Exception as exc:
+            self.message = f"Rebuild failed: {exc}"
+        else:
+            self.result = data  # single reference swap; readers see old or new cache
+            verb = "rebuilt" if force else "ready"
+            self.message = f"Cache {verb} in {time.perf_counter() - self.started:.1f}s."
+    def progress_bar(self, width):
+        frac = self.done / self.total if self.total else 0.0
+        inner = max(10, min(40, width - 20)); fill = int(frac * inner)
+        return f"[{'#' * fill}{'.' * (inner - fill)}] {frac * 100:3.0f}% ({self.done}/{self.total})"
 
 def main():
     obj_path = None
     force = False
+    mode = "wireframe"
     args = [a for a in sys.argv[1:] if a]
-    if args and args[0] == "--rebuild":
-        force = True
+    while args and args[0] in ("--rebuild", "--solid"):
+        if args[0] == "--rebuild": force = True
+        else: mode = "solid"
         args = args[1:]
     if args:
         obj_path = args[0]
         if not os.path.exists(obj_path):
             print("OBJ not found:", obj_path); return
 
-    spinner = OBJSpinner(obj_path=obj_path, aspect=0.5)
-    spinner.build_if_needed(force=force)
+    spinner = OBJSpinner(obj_path=obj_path, aspect=0.5, mode=mode)
+    builder = CacheBuilder(spinner)
+    builder.start(force=force)  # Play stays disabled until the first build lands
 
     app = TerminalApp(title="OBJ Spinner")
-    menu = MenuWidget(items=["Play", "Rebuild Cache", "Exit"])
+    menu = MenuWidget(items=["Play", "Rebuild Cache", "Exit"],
+                      label_of=lambda x: "Cancel Rebuild" if x == "Rebuild Cache" and builder.running() else x,
+                      is_enabled=lambda x: x != "Play" or builder.result is not None)
     state = {"playing": False}
 
     def on_key(ctx, key):
@@ -36,10 +76,14 @@ def main():
             elif key == "DOWN": menu.move(+1)
             elif key == "ENTER":
                 choice = menu.current_label()
-                if choice == "Play":
+                if not menu.is_enabled(menu.current()):
+                    pass
+                elif choice == "Play":
                     state["playing"] = True
                 elif choice == "Rebuild Cache":
-                    spinner.build_if_needed(force=True)
+                    builder.start()
+                elif choice == "Cancel Rebuild":
+                    builder.stop()
                 elif choice == "Exit":
                     ctx.request_exit()
         else:
@@ -57,14 +101,23 @@ def main():
             p = spinner.obj_path
             write(f"Model: {p}")
             write(f"Cache: {spinner.cache_path}")
+            write("")
+            if builder.running():
+                write("Building cache (Enter on Cancel Rebuild to stop)")
+                write(builder.progress_bar(ctx.width))
+            elif builder.message:
+                write(builder.message)
         else:
             write("Playing... Press Enter to return to menu.")
             def key_cb(k):
                 return False if k == "ENTER" else True
-            spinner.playback(fps=30.0, on_key=key_cb)
+            spinner.playback(fps=30.0, on_key=key_cb, data=builder.result)
             state["playing"] = False
 
-    app.run(state={}, menu=menu, on_key=on_key, on_render=on_render, on_update=None, fps=30)
+    try:
+        app.run(state={}, menu=menu, on_key=on_key, on_render=on_render, on_update=None, fps=30)
+    finally:
+        builder.stop(wait=True)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Warm OBJSpinner caches for whole model libraries.
+
+Usage:
+  python scripts/prebuild.py assets/                          # every .obj, current terminal size
+  python scripts/prebuild.py assets/ --size 120x36 --frames 144
+  python scripts/prebuild.py a.obj models/ --size 120x36 --size 200x60 --frames 72 --frames 144
+  python scripts/prebuild.py assets/ --jobs 8 --force         # rebuild everything
+  python scripts/prebuild.py assets/ --mode solid             # shaded-face caches
+
+With a single size and frame count, caches go to the default
+<model>.obj.cache.json that OBJSpinner reads. With several, each variant is
+written to variant_cache_path(...), i.e.
+<model>.obj.<cols>x<rows>.f<frames>.<mode>.a<aspect>.cache.json;
+pass that as OBJSpinner(cache_path=...) at runtime.
+Entries whose cache already matches are skipped.
+"""
+import argparse
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from termarcade.objspin import MIN_COLS, MIN_ROWS, MODES, OBJSpinner, variant_cache_path
+
+
+def find_models(paths):
+    models = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(".obj"):
+                        models.append(os.path.join(root, name))
+        elif os.path.isfile(path):
+            models.append(path)
+        else:
+            raise FileNotFoundError(f"OBJ or directory not found: {path}")
+    seen = set()
+    return [m for m in models if not (m in seen or seen.add(m))]
+
+
+def parse_size(text):
+    try:
+        cols, rows = text.lower().split("x")
+        return int(cols), int(rows)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"size must look like 120x36, got {text!r}") from None
+
+
+def warm(obj_path, cols, rows, frames, aspect, mode, variant, force):
+    """Build one cache entry; returns (status, frames_rendered, seconds)."""
+    start = time.perf_counter()
+    cache_path = variant_cache_path(obj_path, cols, rows, frames, mode, aspect) if variant else None
+    spinner = OBJSpinner(obj_path=obj_path, aspect=aspect, frames=frames, mode=mode, cache_path=cache_path)
+    spinner.build_if_needed(cols, rows, force=force)
+    stats = spinner.last_build_stats
+    return "skipped" if stats["skipped"] else "built", stats["rendered"], time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm OBJSpinner caches for many models.")
+    parser.add_argument("paths", nargs="+", help=".obj files or directories to scan")
+    parser.add_argument("--size", dest="sizes", action="append", type=parse_size,
+                        metavar="COLSxROWS", help="target terminal size (repeatable)")
+    parser.add_argument("--frames", dest="frame_counts", action="append", type=int,
+                        metavar="N", help="frame count (repeatable, default 144)")
+    parser.add_argument("--aspect", type=float, default=0.5)
+    parser.add_argument("--mode", choices=MODES, default="wireframe")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--force", action="store_true", help="rebuild even if the cache matches")
+    args = parser.parse_args(argv)
+
+    try:
+        models = find_models(args.paths)
+    except FileNotFoundError as exc:
+        print(exc)
+        return 1
+    if not models:
+        print("No .obj files found.")
+        return 1
+    if args.sizes:
+        sizes = args.sizes
+    else:  # resolve here so variant names carry the real size
+        cols, rows = shutil.get_terminal_size((120, 36))
+        sizes = [(max(MIN_COLS, cols), max(MIN_ROWS, rows))]
+    frame_counts = args.frame_counts or [144]
+    variant = len(sizes) > 1 or len(frame_counts) > 1
+
+    entries = []
+    for obj_path in models:
+        for cols, rows in sizes:
+            for frames in frame_counts:
+                entries.append((obj_path, cols, rows, frames, args.aspect, args.mode, variant, args.force))
+
+    jobs = max(1, min(args.jobs, len(entries)))
+    counts = {"built": 0, "skipped": 0, "failed": 0}
+    rendered = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(warm, *entry): entry for entry in entries}
+        for future in as_completed(futures):
+            obj_path, cols, rows, frames = futures[future][:4]
+            size = f"{cols}x{rows}"
+            try:
+                status, done, seconds = future.result()
+            except Exception as exc:
+                counts["failed"] += 1
+                print(f"FAILED  {obj_path} [{size}, {frames}f]: {exc}")
+                continue
+            counts[status] += 1
+            rendered += done
+            print(f"{status:<7} {obj_path} [{size}, {frames}f] {seconds:.2f}s")
+    elapsed = time.perf_counter() - start
+
+    print()
+    print(f"{len(models)} models, {len(entries)} entries: {counts['built']} built, "
+          f"{counts['skipped']} skipped, {counts['failed']} failed")
+    print(f"{elapsed:.2f}s wall, {rendered} frames rendered, "
+          f"{rendered / elapsed if elapsed else 0:.1f} frames/s, "
+          f"{counts['built'] / elapsed if elapsed else 0:.2f} caches/s ({jobs} jobs)")
+    return 1 if counts["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
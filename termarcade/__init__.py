@@ -1,4 +1,43 @@
-from .ansi import *
-from .input import *
-from .app import *
-from .objspin import OBJSpinner
+"""
+termarcade — terminal UI engine and OBJ ASCII spinner.
+
+Public names are resolved lazily on first access, so `import termarcade`
+does not load termios/tty, json, or the spinner until they are used.
+
+Note: `termarcade.ansi` is the `termarcade.ansi` submodule. Older releases
+star-imported the package, which shadowed it with the `ansi()` color helper;
+call `termarcade.ansi.ansi(...)` or `from termarcade.ansi import ansi` instead.
+"""
+_LAZY = {
+    # ansi
+    "ESC": "ansi", "RESET": "ansi", "BOLD": "ansi", "DIM": "ansi", "INV": "ansi",
+    "FG": "ansi", "BG": "ansi", "ANSI_RE": "ansi", "style": "ansi",
+    "visible_len": "ansi", "safe_pad": "ansi", "safe_truncate": "ansi", "fit_line": "ansi",
+    # input
+    "IS_WINDOWS": "input", "Keys": "input", "poll_key": "input",
+    # app
+    "Context": "app", "MenuWidget": "app", "TerminalApp": "app", "get_size": "app",
+    "hide_cursor": "app", "show_cursor": "app", "clear_screen": "app", "move_home": "app",
+    # objspin
+    "OBJSpinner": "objspin",
+}
+_SUBMODULES = ("ansi", "input", "app", "objspin")
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBMODULES))
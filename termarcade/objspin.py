@@ -1,3 +1,5 @@
+import glob
+import hashlib
 import json
 import math
 import os
@@ -10,12 +12,35 @@ from .input import poll_key
 
 SHADES = " .:-=+*#%@"
 CACHE_VERSION = 1
+FRAME_STORE_VERSION = 2
+RENDER_VERSION = 2  # bump whenever rendered output changes; stale frames are then ignored
+MAX_FRAME_GROUPS = 8  # frame-store files kept per model (one per size/aspect/mode)
+MAX_STORE_POSES = 2048  # frames kept per store; the least recently written go first
 MIN_COLS = 80
 MIN_ROWS = 24
+MODES = ("wireframe", "solid")
+DEFAULT_CAMERA = {"axis": [0.0, 1.0, 0.0], "tilt": 0.0, "zoom": 1.0, "path": None}
+AMBIENT = 0.15
+LIGHT_DIR = (-0.3487, 0.4650, -0.8137)  # unit vector toward the viewer, up and left
+
+
+class BuildCancelled(Exception):
+    """Raised by a cache build when its `cancel` event is set."""
 
 
 def load_obj_wireframe(path: str):
     """Load OBJ and return (vertices, edges) for wireframe rendering."""
+    verts, edges, _, _ = load_obj_mesh(path)
+    return verts, edges
+
+
+def load_obj_mesh(path: str):
+    """
+    Load OBJ and return (vertices, edges, triangles, lines).
+
+    `edges` covers face outlines and `l` records, `lines` only the `l`
+    records; faces are fan-triangulated into `triangles`.
+    """
     verts = []
     faces = []
     explicit_edges = set()
@@ -80,7 +105,13 @@ def load_obj_wireframe(path: str):
             edges.add((i, j))
     if not verts:
         raise RuntimeError("No vertices in OBJ")
-    return verts, list(edges)
+    tris = []
+    for face in faces:
+        for k in range(1, len(face) - 1):
+            tri = (face[0], face[k], face[k + 1])
+            if len(set(tri)) == 3:
+                tris.append(tri)
+    return verts, list(edges), tris, list(explicit_edges)
 
 
 def normalize(verts):
@@ -96,10 +127,42 @@ def normalize(verts):
     return [(x * s, y * s, z * s) for (x, y, z) in centered]
 
 
-def rot_y(point, angle):
+def camera_matrix(axis, angle, tilt):
+    """Rotation by `angle` degrees about unit `axis`, then `tilt` degrees about X."""
+    kx, ky, kz = axis
+    t = math.radians(angle)
+    c, s, v = math.cos(t), math.sin(t), 1.0 - math.cos(t)
+    spin = (
+        (c + kx * kx * v, kx * ky * v - kz * s, kx * kz * v + ky * s),
+        (ky * kx * v + kz * s, c + ky * ky * v, ky * kz * v - kx * s),
+        (kz * kx * v - ky * s, kz * ky * v + kx * s, c + kz * kz * v),
+    )
+    p = math.radians(tilt)
+    cp, sp = math.cos(p), math.sin(p)
+    r0, r1, r2 = spin
+    return (
+        r0,
+        tuple(cp * a - sp * b for a, b in zip(r1, r2)),
+        tuple(sp * a + cp * b for a, b in zip(r1, r2)),
+    )
+
+
+def rotate(point, m):
     x, y, z = point
-    ca, sa = math.cos(angle), math.sin(angle)
-    return (ca * x + sa * z, y, -sa * x + ca * z)
+    (a, b, c), (d, e, f), (g, h, i) = m
+    return (a * x + b * y + c * z, d * x + e * y + f * z, g * x + h * y + i * z)
+
+
+def interpolate_path(path, u):
+    """Linearly interpolate keyframes (sorted by "t") at loop position u in [0, 1)."""
+    if u <= path[0]["t"]:
+        return path[0]
+    for k0, k1 in zip(path, path[1:]):
+        if u <= k1["t"]:
+            span = k1["t"] - k0["t"]
+            f = (u - k0["t"]) / span if span > 0 else 1.0
+            return {key: k0[key] + (k1[key] - k0[key]) * f for key in ("angle", "tilt", "zoom")}
+    return path[-1]
 
 
 def project(point, fov, cam_d):
@@ -111,7 +174,18 @@ def project(point, fov, cam_d):
     return (x * k, y * k, z)
 
 
-def draw_line(buf, zbuf, p0, p1, w, h, z_to_char):
+def new_extents(w, h):
+    """Empty [min_r, max_r, min_c, max_c] accumulator for the rasterizers."""
+    return [h, -1, w, -1]
+
+
+def extents_bbox(ext):
+    """Turn an extents accumulator into a bbox tuple, or None if nothing was drawn."""
+    return None if ext[1] < 0 else tuple(ext)
+
+
+def draw_line(buf, zbuf, p0, p1, w, h, z_to_char, ext=None, nearest=False):
+    """Plot a depth-tested segment; the larger z wins unless `nearest` is set."""
     (x0, y0, z0) = p0
     (x1, y1, z1) = p1
     steps = int(max(8, min(600, max(abs(x1 - x0), abs(y1 - y0)) * 1.6)))
@@ -121,41 +195,141 @@ def draw_line(buf, zbuf, p0, p1, w, h, z_to_char):
         y = y0 + (y1 - y0) * t
         z = z0 + (z1 - z0) * t
         ix, iy = int(round(x)), int(round(y))
-        if 0 <= ix < w and 0 <= iy < h and z > zbuf[iy][ix]:
+        if 0 <= ix < w and 0 <= iy < h and ((z < zbuf[iy][ix]) if nearest else (z > zbuf[iy][ix])):
             zbuf[iy][ix] = z
-            buf[iy][ix] = z_to_char(z)
-
-
-def buffer_to_string(buf):
-    return "\n".join("".join(row) for row in buf)
-
-
-def compute_bbox_union(buffers):
-    min_r = min_c = 10**9
-    max_r = max_c = -10**9
-    for buf in buffers:
-        h = len(buf)
-        w = len(buf[0]) if h else 0
-        for r in range(h):
-            row = buf[r]
-            for c in range(w):
-                if row[c] != " ":
-                    if r < min_r:
-                        min_r = r
-                    if r > max_r:
-                        max_r = r
-                    if c < min_c:
-                        min_c = c
-                    if c > max_c:
-                        max_c = c
-    if max_r < min_r or max_c < min_c:
-        return (0, 0, 0, 0)
-    return (min_r, max_r, min_c, max_c)
-
+            ch = z_to_char(z)
+            buf[iy][ix] = ch
+            if ext is not None and ch != " ":
+                if iy < ext[0]:
+                    ext[0] = iy
+                if iy > ext[1]:
+                    ext[1] = iy
+                if ix < ext[2]:
+                    ext[2] = ix
+                if ix > ext[3]:
+                    ext[3] = ix
+
+
+def fill_triangle(buf, zbuf, p0, p1, p2, w, h, ch, ext=None):
+    """Rasterize a screen-space triangle with incremental edge functions.
+
+    Cells are sampled at their centres; the nearest (smallest z) surface wins.
+    Written cells grow the `ext` accumulator (see new_extents).
+    """
+    (x0, y0, z0) = p0
+    (x1, y1, z1) = p1
+    (x2, y2, z2) = p2
+    area = (x1 - x0) * (y2 - y0) - (y1 - y0) * (x2 - x0)
+    if area < 0:
+        (x1, y1, z1), (x2, y2, z2) = (x2, y2, z2), (x1, y1, z1)
+        area = -area
+    if area < 1e-9:
+        return
+    min_x = max(0, int(math.floor(min(x0, x1, x2))))
+    max_x = min(w - 1, int(math.ceil(max(x0, x1, x2))))
+    min_y = max(0, int(math.floor(min(y0, y1, y2))))
+    max_y = min(h - 1, int(math.ceil(max(y0, y1, y2))))
+    if min_x > max_x or min_y > max_y:
+        return
+    # Edge function e_ab(p) = (bx - ax) * (py - ay) - (by - ay) * (px - ax),
+    # stepped by its x/y partial derivatives instead of re-evaluated per cell.
+    a0, b0 = y1 - y2, x2 - x1
+    a1, b1 = y2 - y0, x0 - x2
+    a2, b2 = y0 - y1, x1 - x0
+    px, py = min_x + 0.5, min_y + 0.5
+    w0_row = b0 * (py - y1) + a0 * (px - x1)
+    w1_row = b1 * (py - y2) + a1 * (px - x2)
+    w2_row = b2 * (py - y0) + a2 * (px - x0)
+    inv = 1.0 / area
+    dzdx = (a0 * z0 + a1 * z1 + a2 * z2) * inv
+    dzdy = (b0 * z0 + b1 * z1 + b2 * z2) * inv
+    z_row = (w0_row * z0 + w1_row * z1 + w2_row * z2) * inv
+    for y in range(min_y, max_y + 1):
+        w0, w1, w2, z = w0_row, w1_row, w2_row, z_row
+        brow = buf[y]
+        zrow = zbuf[y]
+        lo = hi = -1
+        for x in range(min_x, max_x + 1):
+            if w0 >= 0 and w1 >= 0 and w2 >= 0 and z < zrow[x]:
+                zrow[x] = z
+                brow[x] = ch
+                if lo < 0:
+                    lo = x
+                hi = x
+            w0 += a0
+            w1 += a1
+            w2 += a2
+            z += dzdx
+        if lo >= 0 and ext is not None:
+            if y < ext[0]:
+                ext[0] = y
+            if y > ext[1]:
+                ext[1] = y
+            if lo < ext[2]:
+                ext[2] = lo
+            if hi > ext[3]:
+                ext[3] = hi
+        w0_row += b0
+        w1_row += b1
+        w2_row += b2
+        z_row += dzdy
+
+
+def lambert_char(a, b, c):
+    """Flat-shade a camera-space triangle; faces are lit from both sides."""
+    ux, uy, uz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+    vx, vy, vz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+    nx, ny, nz = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+    n = (nx * nx + ny * ny + nz * nz) ** 0.5
+    if n < 1e-12:
+        return SHADES[1]
+    lx, ly, lz = LIGHT_DIR
+    lit = abs(nx * lx + ny * ly + nz * lz) / n
+    t = AMBIENT + (1.0 - AMBIENT) * lit
+    return SHADES[1 + int(t * (len(SHADES) - 2) + 0.5)]
+
+
+def crop_entry(buf, bbox):
+    """Copy only the cells inside `bbox` (tracked while rasterizing) as a frame-store entry."""
+    if bbox is None:
+        return [None, []]
+    r0, r1, c0, c1 = bbox
+    return [list(bbox), ["".join(row[c0 : c1 + 1]) for row in buf[r0 : r1 + 1]]]
+
+
+def assemble_frames(entries):
+    """
+    Pad per-frame crops to their union box.
 
-def crop(buf, bbox):
-    a, b, c, d = bbox
-    return [row[c : d + 1] for row in buf[a : b + 1]]
+    `entries` holds (bbox, rows) pairs where `rows` are the strings inside
+    `bbox`. Returns (frames, width, height).
+    """
+    boxes = [bbox for bbox, _ in entries if bbox]
+    if not boxes:
+        return ["" for _ in entries], 0, 0
+    top = min(b[0] for b in boxes)
+    bottom = max(b[1] for b in boxes)
+    left = min(b[2] for b in boxes)
+    right = max(b[3] for b in boxes)
+    width = right - left + 1
+    blank = " " * width
+    frames = []
+    for bbox, rows in entries:
+        if not bbox:
+            frames.append("\n".join(blank for _ in range(top, bottom + 1)))
+            continue
+        r0, r1, c0, c1 = bbox
+        pad_l, pad_r = " " * (c0 - left), " " * (right - c1)
+        lines = [blank] * (r0 - top)
+        lines.extend(pad_l + row + pad_r for row in rows)
+        lines.extend([blank] * (bottom - r1))
+        frames.append("\n".join(lines))
+    return frames, width, bottom - top + 1
+
+
+def variant_cache_path(obj_path: str, cols: int, rows: int, frames: int, mode: str, aspect: float) -> str:
+    """Cache path for one (terminal size, frame count, mode, aspect) variant of a model."""
+    return f"{obj_path}.{cols}x{rows}.f{frames}.{mode}.a{aspect:g}.cache.json"
 
 
 class OBJSpinner:
@@ -165,14 +339,33 @@ class OBJSpinner:
     Build and cache ASCII frames for a horizontally spinning OBJ model.
     - Provide `obj_path` or use built-in Lambda.
     - Call build_if_needed(), then playback().
-    Cache file: <obj_path>.cache.json (side-by-side with the obj).
+    - mode="wireframe" draws edges; mode="solid" fills z-buffered,
+      Lambert-shaded faces plus any `l` polylines (falling back to edges for
+      meshes without faces).
+    - The camera spins `axis` (default Y) through 360°, tilted by `tilt`
+      degrees about X and scaled by `zoom`; or follows a keyframed `path`
+      of {"t", "angle", "tilt", "zoom"} dicts with t in [0, 1].
+    Cache file: <obj_path>.cache.json (side-by-side with the obj) unless
+    `cache_path` is given. Rendered frames are also kept per camera pose in
+    <obj_path>.<digest>.frames.json (one file per size/aspect/mode), so new
+    frame counts or paths only render poses that have not been seen before.
     """
 
-    def __init__(self, obj_path: str | None = None, aspect: float = 0.5, frames: int = 144):
+    def __init__(self, obj_path: str | None = None, aspect: float = 0.5, frames: int = 144,
+                 cache_path: str | None = None, mode: str = "wireframe",
+                 axis=(0.0, 1.0, 0.0), tilt: float = 0.0, zoom: float = 1.0, path=None,
+                 frame_store_prefix: str | None = None):
         self.obj_path = obj_path or self._default_lambda_path()
         self.aspect = self._validate_aspect(aspect)
         self.frames = self._validate_frames(frames)
-        self.cache_path = self._default_cache_path()
+        self.mode = self._validate_mode(mode)
+        self.axis = self._validate_axis(axis)
+        self.tilt = self._validate_number("tilt", tilt)
+        self.zoom = self._validate_zoom(zoom)
+        self.path = self._validate_path(path, self.tilt, self.zoom)
+        self.cache_path = cache_path or self._default_cache_path()
+        self.frame_store_prefix = frame_store_prefix or self.obj_path
+        self.last_build_stats = {"rendered": 0, "reused": 0, "skipped": False}
 
     def _default_lambda_path(self) -> str:
         here = os.path.dirname(__file__)
@@ -189,6 +382,82 @@ class OBJSpinner:
             raise ValueError("frames must be a positive integer")
         return value
 
+    @staticmethod
+    def _validate_mode(value: str) -> str:
+        if value not in MODES:
+            raise ValueError(f"mode must be one of {', '.join(MODES)}")
+        return value
+
+    @staticmethod
+    def _validate_number(name, value) -> float:
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be numeric") from None
+        if not math.isfinite(number):
+            raise ValueError(f"{name} must be finite")
+        return number
+
+    @classmethod
+    def _validate_zoom(cls, value) -> float:
+        zoom = cls._validate_number("zoom", value)
+        if zoom <= 0:
+            raise ValueError("zoom must be greater than zero")
+        return zoom
+
+    @classmethod
+    def _validate_axis(cls, value):
+        try:
+            x, y, z = (cls._validate_number("axis", v) for v in value)
+        except (TypeError, ValueError):
+            raise ValueError("axis must be three numbers") from None
+        n = (x * x + y * y + z * z) ** 0.5
+        if n < 1e-12:
+            raise ValueError("axis must not be the zero vector")
+        return (x / n, y / n, z / n)
+
+    @classmethod
+    def _validate_path(cls, value, tilt, zoom):
+        if value is None:
+            return None
+        try:
+            keys = list(value)
+        except TypeError:
+            raise ValueError("path must be a list of keyframes") from None
+        if not keys:
+            raise ValueError("path must contain at least one keyframe")
+        path = []
+        for key in keys:
+            if not isinstance(key, dict) or "t" not in key:
+                raise ValueError("path keyframes must be dicts with a 't' entry")
+            t = cls._validate_number("t", key["t"])
+            if not 0.0 <= t <= 1.0:
+                raise ValueError("keyframe t must be within [0, 1]")
+            path.append({
+                "t": t,
+                "angle": cls._validate_number("angle", key.get("angle", 0.0)),
+                "tilt": cls._validate_number("tilt", key.get("tilt", tilt)),
+                "zoom": cls._validate_zoom(key.get("zoom", zoom)),
+            })
+        path.sort(key=lambda k: k["t"])
+        return path
+
+    def _camera(self):
+        return {"axis": list(self.axis), "tilt": self.tilt, "zoom": self.zoom, "path": self.path}
+
+    def _pose(self, i):
+        """Camera pose (angle, tilt, zoom) for frame i, rounded so equal poses share a key."""
+        u = i / self.frames
+        if self.path is None:
+            angle, tilt, zoom = 360.0 * u, self.tilt, self.zoom
+        else:
+            key = interpolate_path(self.path, u)
+            angle, tilt, zoom = key["angle"], key["tilt"], key["zoom"]
+        return (round(angle % 360.0, 6) % 360.0, round(tilt, 6), round(zoom, 6))
+
+    def _pose_key(self, pose):
+        return "{:.6f},{:.6f},{:.6f}|{:.6f},{:.6f},{:.6f}".format(*self.axis, *pose)
+
     @staticmethod
     def _validate_aspect(value: float) -> float:
         try:
@@ -199,16 +468,45 @@ class OBJSpinner:
             raise ValueError("aspect must be greater than zero")
         return aspect
 
-    def _render_buffer(self, angle, size, verts, edges):
+    def _render_buffer(self, pose, size, verts, edges, tris=None, lines=None):
+        angle, tilt, zoom = pose
         cols, rows = size
         w, h = cols, rows
         buf = [[" " for _ in range(w)] for _ in range(h)]
-        zbuf = [[-1e9 for _ in range(w)] for _ in range(h)]
-        fov = min(w, h) * 0.98
+        fov = min(w, h) * 0.98 * zoom
         cam_d = 4.0
         scale = 1.0
-        rverts = [rot_y(v, angle) for v in verts]
+        m = camera_matrix(self.axis, angle, tilt)
+        rverts = [rotate(v, m) for v in verts]
         projected = [project(v, fov, cam_d) for v in rverts]
+        ext = new_extents(w, h)
+        if tris:
+            zbuf = [[1e9 for _ in range(w)] for _ in range(h)]
+            screen = [
+                (w * 0.5 + px * scale, h * 0.5 - py * scale * self.aspect, pz)
+                for (px, py, pz) in projected
+            ]
+            for (i, j, k) in tris:
+                ch = lambert_char(rverts[i], rverts[j], rverts[k])
+                fill_triangle(buf, zbuf, screen[i], screen[j], screen[k], w, h, ch, ext)
+            if lines:
+                # Explicit `l` polylines stay visible over the surfaces they are
+                # not hidden by; nearer segments use denser shades.
+                zs = [pz for _, _, pz in projected]
+                zmin, zmax = min(zs), max(zs)
+                span = max(zmax - zmin, 1e-6)
+
+                def line_char(z):
+                    t = (zmax - z) / span
+                    t = 0.0 if t < 0 else (1.0 if t > 1 else t)
+                    return SHADES[1 + int(t * (len(SHADES) - 2))]
+
+                for (i, j) in lines:
+                    p0 = (int(screen[i][0]), int(screen[i][1]), screen[i][2])
+                    p1 = (int(screen[j][0]), int(screen[j][1]), screen[j][2])
+                    draw_line(buf, zbuf, p0, p1, w, h, line_char, ext, nearest=True)
+            return buf, extents_bbox(ext)
+        zbuf = [[-1e9 for _ in range(w)] for _ in range(h)]
         zs = [pz for _, _, pz in projected]
         zmin, zmax = (min(zs), max(zs)) if zs else (0.0, 1.0)
         if zmax - zmin < 1e-6:
@@ -227,26 +525,50 @@ class OBJSpinner:
         for (i, j) in edges:
             (sx0, sy0, z0) = screen[i]
             (sx1, sy1, z1) = screen[j]
-            draw_line(buf, zbuf, (sx0, sy0, z0), (sx1, sy1, z1), w, h, z_to_char)
-        return buf
-
-    def _build_cache(self, cols, rows, signature):
-        verts, edges = load_obj_wireframe(self.obj_path)
-        verts = normalize(verts)
-        bufs = []
+            draw_line(buf, zbuf, (sx0, sy0, z0), (sx1, sy1, z1), w, h, z_to_char, ext)
+        return buf, extents_bbox(ext)
+
+    def _build_cache(self, cols, rows, signature, progress=None, cancel=None, reuse=True):
+        store_path, header = self._frame_store(cols, rows, signature)
+        stored = self._read_frame_store(store_path, header)
+        lookup = stored if reuse else {}
+        fresh = {}
+        mesh = None
+        entries = []
         for i in range(self.frames):
-            ang = (2.0 * math.pi) * (i / self.frames)
-            bufs.append(self._render_buffer(ang, (cols, rows), verts, edges))
-        bbox = compute_bbox_union(bufs)
-        frames = [buffer_to_string(crop(b, bbox)) for b in bufs]
+            pose = self._pose(i)
+            key = self._pose_key(pose)
+            entry = fresh.get(key) or lookup.get(key)
+            if entry is None:
+                if cancel is not None and cancel.is_set():
+                    if fresh:
+                        self._save_frame_store(store_path, header, stored, fresh)
+                    raise BuildCancelled(self.obj_path)
+                if mesh is None:
+                    verts, edges, tris, lines = load_obj_mesh(self.obj_path)
+                    solid = self.mode == "solid"
+                    mesh = (normalize(verts), edges, tris if solid else None, lines if solid else None)
+                buf, bbox = self._render_buffer(pose, (cols, rows), *mesh)
+                entry = crop_entry(buf, bbox)
+                fresh[key] = entry
+            entries.append(entry)
+            if progress:
+                progress(i + 1, self.frames)
+        self.last_build_stats = {"rendered": len(fresh), "reused": self.frames - len(fresh), "skipped": False}
+        if fresh:
+            self._save_frame_store(store_path, header, stored, fresh)
+        frames, width, height = assemble_frames(entries)
         payload = {
             "frames": frames,
-            "width": len(frames[0].split("\n")[0]) if frames else 0,
-            "height": len(frames[0].split("\n")) if frames else 0,
+            "width": width,
+            "height": height,
             "version": CACHE_VERSION,
             "params": {
                 "frames": self.frames,
                 "aspect": self.aspect,
+                "mode": self.mode,
+                "camera": self._camera(),
+                "render_version": RENDER_VERSION,
                 "cols": cols,
                 "rows": rows,
                 "obj_signature": signature,
@@ -255,6 +577,69 @@ class OBJSpinner:
         self._write_cache(payload)
         return payload
 
+    def _frame_store(self, cols, rows, signature):
+        """
+        Return (path, header) of the frame store for these render settings.
+
+        Frames are interchangeable only when the header (settings, model
+        signature and RENDER_VERSION) matches; the file name ignores the
+        signature and version so a stale store is overwritten in place.
+        """
+        group = [cols, rows, self.aspect, self.mode]
+        digest = hashlib.sha1(json.dumps(group).encode("utf-8")).hexdigest()[:12]
+        header = {
+            "version": FRAME_STORE_VERSION,
+            "render_version": RENDER_VERSION,
+            "group": group,
+            "obj_signature": signature,
+        }
+        return f"{self.frame_store_prefix}.{digest}.frames.json", header
+
+    @staticmethod
+    def _read_frame_store(path, header):
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("header") != header:
+            return {}
+        frames = data.get("frames")
+        return frames if isinstance(frames, dict) else {}
+
+    def _save_frame_store(self, path, header, stored, fresh):
+        # Merge into the store read at the start of the build, so poses of other
+        # frame counts and camera paths survive, even after a forced build.
+        # This is not locked: two builds of the same size/aspect/mode running
+        # at once may drop some of each other's new frames, which only costs a
+        # re-render later.
+        frames = {key: entry for key, entry in stored.items() if key not in fresh}
+        frames.update(fresh)
+        for key in list(frames)[:max(0, len(frames) - MAX_STORE_POSES)]:
+            del frames[key]
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"header": header, "frames": frames}, handle)
+        os.replace(tmp_path, path)
+        self._evict_frame_stores(path)
+
+    def _evict_frame_stores(self, keep):
+        """Delete the least recently written stores beyond MAX_FRAME_GROUPS."""
+        pattern = f"{glob.escape(self.frame_store_prefix)}.*.frames.json"
+        stores = []
+        for path in glob.glob(pattern):
+            try:
+                stores.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        stores.sort(reverse=True)
+        for _, path in stores[MAX_FRAME_GROUPS:]:
+            if path != keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
     def _write_cache(self, payload):
         tmp_path = self.cache_path + ".tmp"
         with open(tmp_path, "w", encoding="utf-8") as handle:
@@ -287,6 +672,9 @@ class OBJSpinner:
         return (
             params.get("frames") == self.frames
             and params.get("aspect") == self.aspect
+            and params.get("mode", "wireframe") == self.mode
+            and params.get("camera", DEFAULT_CAMERA) == self._camera()
+            and params.get("render_version", 1) == RENDER_VERSION
             and params.get("cols") == cols
             and params.get("rows") == rows
             and params.get("obj_signature") == signature
@@ -304,17 +692,33 @@ class OBJSpinner:
             raise ValueError("cols and rows must be positive")
         return max(MIN_COLS, cols), max(MIN_ROWS, rows)
 
-    def build_if_needed(self, cols: int | None = None, rows: int | None = None, force: bool = False):
+    def build_if_needed(self, cols: int | None = None, rows: int | None = None, force: bool = False,
+                        progress=None, cancel=None):
+        """
+        Return the cache payload, rebuilding it when stale or when `force` is set.
+
+        `progress(done, total)` is called after every rendered frame. If
+        `cancel` (e.g. a threading.Event) is set mid-build, BuildCancelled is
+        raised and the existing cache file is left untouched; the new cache
+        only replaces it once fully written. A forced build skips the frame
+        store lookup and re-renders every frame; the new frames still replace
+        their poses in the store, keeping the others. `last_build_stats`
+        reports the rendered and reused frame counts, with `skipped` set when
+        the existing cache already matched.
+        """
         cols, rows = self._resolve_dims(cols, rows)
         signature = self._obj_signature()
         if not force:
             cached = self._load_cache()
             if cached and self._cache_matches(cached, cols, rows, signature):
+                self.last_build_stats = {"rendered": 0, "reused": 0, "skipped": True}
                 return cached
-        return self._build_cache(cols, rows, signature)
+        return self._build_cache(cols, rows, signature, progress=progress, cancel=cancel,
+                                 reuse=not force)
 
-    def playback(self, fps: float = 30.0, on_key=None):
-        data = self.build_if_needed()
+    def playback(self, fps: float = 30.0, on_key=None, data=None):
+        if data is None:
+            data = self.build_if_needed()
         frames = data.get("frames") or []
         if not frames:
             raise RuntimeError("Spinner cache contains no frames")
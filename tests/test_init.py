@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import termarcade
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_import_does_not_load_submodules(self):
+        code = (
+            "import sys, termarcade\n"
+            "loaded = [m for m in ('termarcade.app', 'termarcade.objspin', 'termarcade.input',"
+            " 'termarcade.ansi', 'termios', 'tty') if m in sys.modules]\n"
+            "print(','.join(loaded))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                             text=True, env=env, check=True).stdout.strip()
+        self.assertEqual(out, "")
+
+    def test_public_names_resolve(self):
+        from termarcade.app import TerminalApp
+        from termarcade.objspin import OBJSpinner
+
+        self.assertIs(termarcade.TerminalApp, TerminalApp)
+        self.assertIs(termarcade.OBJSpinner, OBJSpinner)
+        self.assertEqual(termarcade.Keys.ENTER, "ENTER")
+        self.assertIn("fit_line", dir(termarcade))
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            termarcade.does_not_exist
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import launcher  # noqa: E402
+
+from termarcade.objspin import OBJSpinner  # noqa: E402
+
+MODEL = "v 0 0 0\nv 1 0 0\nv 0 1 0\nl 1 2 3\n"
+
+
+class CacheBuilderTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.model_path = Path(self.tmp.name) / "model.obj"
+        self.model_path.write_text(MODEL, encoding="utf-8")
+        self.spinner = OBJSpinner(obj_path=str(self.model_path), frames=4)
+
+    def run_build(self, builder, force=True):
+        builder.start(force=force)
+        builder.thread.join(timeout=30)
+        self.assertFalse(builder.running())
+
+    def test_start_builds_in_background_and_sets_result(self):
+        builder = launcher.CacheBuilder(self.spinner)
+        self.assertIsNone(builder.result)
+        self.run_build(builder, force=False)
+        self.assertEqual(len(builder.result["frames"]), 4)
+        self.assertTrue(builder.message.startswith("Cache ready in "))
+        self.run_build(builder)
+        self.assertTrue(builder.message.startswith("Cache rebuilt in "))
+
+    def test_progress_tracks_rendered_frames(self):
+        builder = launcher.CacheBuilder(self.spinner)
+        seen = []
+        progress = builder._progress
+        builder._progress = lambda done, total: (seen.append((done, total)), progress(done, total))
+        self.run_build(builder)
+        self.assertEqual(seen, [(1, 4), (2, 4), (3, 4), (4, 4)])
+        self.assertEqual((builder.done, builder.total), (4, 4))
+        self.assertIn("100% (4/4)", builder.progress_bar(80))
+
+    def test_stop_cancels_and_keeps_previous_result(self):
+        builder = launcher.CacheBuilder(self.spinner)
+        self.run_build(builder)
+        previous = builder.result
+        builder._progress = lambda done, total: builder.stop()
+        self.run_build(builder)
+        self.assertEqual(builder.message, "Rebuild cancelled.")
+        self.assertIs(builder.result, previous)
+
+    def test_failed_build_reports_and_keeps_result(self):
+        builder = launcher.CacheBuilder(self.spinner)
+        self.model_path.unlink()
+        self.run_build(builder)
+        self.assertTrue(builder.message.startswith("Rebuild failed: OBJ not found"))
+        self.assertIsNone(builder.result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,19 @@
 import json
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 
-from termarcade.objspin import OBJSpinner, load_obj_wireframe
+from termarcade.objspin import (
+    MAX_FRAME_GROUPS,
+    MAX_STORE_POSES,
+    BuildCancelled,
+    OBJSpinner,
+    load_obj_mesh,
+    load_obj_wireframe,
+    normalize,
+    variant_cache_path,
+)
 
 
 class ObjSpinTests(unittest.TestCase):
@@ -52,6 +62,178 @@ class ObjSpinTests(unittest.TestCase):
         self.assertEqual(len(verts), 3)
         self.assertTrue(edges)
 
+    def test_build_reports_progress_per_frame(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=4)
+        seen = []
+        spinner.build_if_needed(cols=80, rows=24, force=True,
+                                progress=lambda done, total: seen.append((done, total)))
+        self.assertEqual(seen, [(1, 4), (2, 4), (3, 4), (4, 4)])
+
+    def test_cancelled_build_keeps_existing_cache(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=2)
+        spinner.build_if_needed(cols=80, rows=24, force=True)
+        before = Path(spinner.cache_path).read_text(encoding="utf-8")
+        cancel = threading.Event()
+        rebuild = OBJSpinner(obj_path=str(self.model_path), frames=6)
+        with self.assertRaises(BuildCancelled):
+            rebuild.build_if_needed(cols=80, rows=24, force=True, cancel=cancel,
+                                    progress=lambda done, total: cancel.set())
+        self.assertEqual(Path(spinner.cache_path).read_text(encoding="utf-8"), before)
+
+    def test_variant_cache_path_is_used(self):
+        path = variant_cache_path(str(self.model_path), 100, 30, 2, "wireframe", 0.5)
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=2, cache_path=path)
+        spinner.build_if_needed(cols=100, rows=30)
+        self.assertTrue(Path(path).exists())
+        self.assertFalse(Path(f"{self.model_path}.cache.json").exists())
+
+    def test_faces_are_fan_triangulated(self):
+        path = Path(self.tmp.name) / "quad.obj"
+        path.write_text("v -1 -1 0\nv 1 -1 0\nv 1 1 0\nv -1 1 0\nf 1 2 3 4\n", encoding="utf-8")
+        verts, edges, tris, lines = load_obj_mesh(str(path))
+        self.assertEqual(len(edges), 4)
+        self.assertEqual(tris, [(0, 1, 2), (0, 2, 3)])
+        self.assertEqual(lines, [])
+
+    def test_solid_mode_fills_faces_and_keys_cache(self):
+        path = Path(self.tmp.name) / "quad.obj"
+        path.write_text("v -1 -1 0\nv 1 -1 0\nv 1 1 0\nv -1 1 0\nf 1 2 3 4\n", encoding="utf-8")
+        solid = OBJSpinner(obj_path=str(path), frames=1, mode="solid")
+        data = solid.build_if_needed(cols=80, rows=24)
+        self.assertEqual(data["params"]["mode"], "solid")
+        rows = data["frames"][0].split("\n")
+        self.assertNotIn(" ", rows[len(rows) // 2])  # interior is filled, not just outlined
+
+        wire = OBJSpinner(obj_path=str(path), frames=1)
+        self.assertFalse(wire._cache_matches(data, 80, 24, wire._obj_signature()))
+        with self.assertRaises(ValueError):
+            OBJSpinner(obj_path=str(path), mode="shaded")
+
+    def test_extending_frames_renders_only_new_poses(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=4)
+        spinner.build_if_needed(cols=80, rows=24)
+        self.assertEqual(spinner.last_build_stats, {"rendered": 4, "reused": 0, "skipped": False})
+        spinner.build_if_needed(cols=80, rows=24)
+        self.assertEqual(spinner.last_build_stats, {"rendered": 0, "reused": 0, "skipped": True})
+
+        doubled = OBJSpinner(obj_path=str(self.model_path), frames=8)
+        data = doubled.build_if_needed(cols=80, rows=24)
+        self.assertEqual(doubled.last_build_stats, {"rendered": 4, "reused": 4, "skipped": False})
+        self.assertEqual(len(data["frames"]), 8)
+
+        fresh = OBJSpinner(obj_path=str(self.model_path), frames=8)
+        self.assertEqual(fresh.build_if_needed(cols=80, rows=24, force=True)["frames"], data["frames"])
+        self.assertEqual(fresh.last_build_stats["rendered"], 8)
+
+    def test_forced_build_renders_every_frame(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=4)
+        spinner.build_if_needed(cols=80, rows=24)
+        spinner.build_if_needed(cols=80, rows=24, force=True)
+        self.assertEqual(spinner.last_build_stats, {"rendered": 4, "reused": 0, "skipped": False})
+
+    def _stored_poses(self, spinner):
+        path, header = spinner._frame_store(80, 24, spinner._obj_signature())
+        return spinner._read_frame_store(path, header)
+
+    def test_forced_build_keeps_other_stored_poses(self):
+        OBJSpinner(obj_path=str(self.model_path), frames=8).build_if_needed(cols=80, rows=24)
+        half = OBJSpinner(obj_path=str(self.model_path), frames=4)
+        half.build_if_needed(cols=80, rows=24, force=True)
+        self.assertEqual(len(self._stored_poses(half)), 8)
+
+    def test_cancelled_forced_build_keeps_stored_poses(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=8)
+        spinner.build_if_needed(cols=80, rows=24)
+        cancel = threading.Event()
+        seen = []
+
+        def progress(done, total):
+            seen.append(done)
+            if done == 3:
+                cancel.set()
+
+        with self.assertRaises(BuildCancelled):
+            spinner.build_if_needed(cols=80, rows=24, force=True, progress=progress, cancel=cancel)
+        self.assertEqual(seen, [1, 2, 3])
+        self.assertEqual(len(self._stored_poses(spinner)), 8)
+
+    def test_frame_store_drops_oldest_poses_beyond_cap(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=2)
+        path, header = spinner._frame_store(80, 24, spinner._obj_signature())
+        old = {f"old{i}": [None, []] for i in range(MAX_STORE_POSES)}
+        spinner._save_frame_store(path, header, old, {"new": [None, []]})
+        frames = spinner._read_frame_store(path, header)
+        self.assertEqual(len(frames), MAX_STORE_POSES)
+        self.assertNotIn("old0", frames)
+        self.assertIn("new", frames)
+
+    def test_frame_store_ignores_other_render_versions(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=2)
+        spinner.build_if_needed(cols=80, rows=24)
+        path, header = spinner._frame_store(80, 24, spinner._obj_signature())
+        self.assertEqual(len(spinner._read_frame_store(path, header)), 2)
+        stale = dict(header, render_version=header["render_version"] - 1)
+        self.assertEqual(spinner._read_frame_store(path, stale), {})
+
+    def test_frame_stores_are_per_size_and_bounded(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=1)
+        for cols in range(80, 80 + MAX_FRAME_GROUPS + 3):
+            spinner.build_if_needed(cols=cols, rows=24)
+        stores = list(Path(self.tmp.name).glob("model.obj.*.frames.json"))
+        self.assertEqual(len(stores), MAX_FRAME_GROUPS)
+
+    def test_camera_settings_invalidate_cache(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=2)
+        data = spinner.build_if_needed(cols=80, rows=24)
+        signature = spinner._obj_signature()
+        for kwargs in ({"tilt": 20}, {"zoom": 1.5}, {"axis": (1, 0, 0)},
+                       {"path": [{"t": 0, "angle": 0}, {"t": 1, "angle": 90}]}):
+            other = OBJSpinner(obj_path=str(self.model_path), frames=2, **kwargs)
+            self.assertFalse(other._cache_matches(data, 80, 24, signature), kwargs)
+
+    def test_camera_path_interpolates_keyframes(self):
+        spinner = OBJSpinner(obj_path=str(self.model_path), frames=4,
+                             path=[{"t": 1, "angle": 90, "zoom": 2}, {"t": 0, "angle": 10}])
+        self.assertEqual(spinner._pose(0), (10.0, 0.0, 1.0))
+        self.assertEqual(spinner._pose(2), (50.0, 0.0, 1.5))
+        with self.assertRaises(ValueError):
+            OBJSpinner(obj_path=str(self.model_path), axis=(0, 0, 0))
+        with self.assertRaises(ValueError):
+            OBJSpinner(obj_path=str(self.model_path), path=[{"t": 2}])
+
+    def test_tracked_extents_match_buffer_scan(self):
+        path = Path(self.tmp.name) / "quad.obj"
+        path.write_text("v -1 -1 0\nv 1 -1 0\nv 1 1 0\nv -1 1 0\nf 1 2 3 4\n", encoding="utf-8")
+        verts, edges, tris, _ = load_obj_mesh(str(path))
+        verts = normalize(verts)
+        for mode in ("wireframe", "solid"):
+            spinner = OBJSpinner(obj_path=str(path), frames=6, mode=mode)
+            for i in range(6):
+                buf, bbox = spinner._render_buffer(spinner._pose(i), (80, 24), verts, edges,
+                                                   tris if mode == "solid" else None)
+                cells = [(r, c) for r, row in enumerate(buf) for c, ch in enumerate(row) if ch != " "]
+                expected = None
+                if cells:
+                    rs, cs = [r for r, _ in cells], [c for _, c in cells]
+                    expected = (min(rs), max(rs), min(cs), max(cs))
+                self.assertEqual(bbox, expected, (mode, i))
+
+    def test_solid_mode_keeps_polylines_of_mixed_models(self):
+        path = Path(self.tmp.name) / "mixed.obj"
+        path.write_text(
+            "v -1 -1 0\nv 1 -1 0\nv 1 1 0\nv 0 -1 -1\nv 0 -1 -2\nf 1 2 3\nl 4 5\n",
+            encoding="utf-8",
+        )
+        verts, edges, tris, lines = load_obj_mesh(str(path))
+        self.assertEqual(lines, [(3, 4)])
+        spinner = OBJSpinner(obj_path=str(path), frames=4, mode="solid")
+        verts = normalize(verts)
+        pose = spinner._pose(1)  # side view: the face is edge-on, the line is not
+        with_lines, _ = spinner._render_buffer(pose, (80, 24), verts, edges, tris, lines)
+        without, _ = spinner._render_buffer(pose, (80, 24), verts, edges, tris)
+        count = lambda buf: sum(ch != " " for row in buf for ch in row)
+        self.assertGreater(count(with_lines), count(without))
+
     def test_invalid_frame_count_rejected(self):
         with self.assertRaises(ValueError):
             OBJSpinner(obj_path=str(self.model_path), frames=0)
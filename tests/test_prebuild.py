@@ -0,0 +1,80 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import prebuild  # noqa: E402
+
+from termarcade.objspin import variant_cache_path  # noqa: E402
+
+MODEL = "v 0 0 0\nv 1 0 0\nv 0 1 0\nl 1 2 3\n"
+
+
+class PrebuildTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        (self.root / "sub").mkdir()
+        for rel in ("b.obj", "a.OBJ", "sub/c.obj"):
+            (self.root / rel).write_text(MODEL, encoding="utf-8")
+        (self.root / "notes.txt").write_text("not a model", encoding="utf-8")
+
+    def run_main(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = prebuild.main([str(a) for a in argv])
+        return code, out.getvalue()
+
+    def test_find_models_recurses_sorts_and_dedups(self):
+        a, b, c = (str(self.root / rel) for rel in ("a.OBJ", "b.obj", "sub/c.obj"))
+        self.assertEqual(prebuild.find_models([str(self.root), b]), [a, b, c])
+        with self.assertRaises(FileNotFoundError):
+            prebuild.find_models([str(self.root / "missing")])
+
+    def test_second_warm_is_skipped(self):
+        obj = str(self.root / "b.obj")
+        status, rendered, _ = prebuild.warm(obj, 80, 24, 2, 0.5, "wireframe", False, False)
+        self.assertEqual((status, rendered), ("built", 2))
+        self.assertTrue(Path(f"{obj}.cache.json").exists())
+        status, rendered, _ = prebuild.warm(obj, 80, 24, 2, 0.5, "wireframe", False, False)
+        self.assertEqual((status, rendered), ("skipped", 0))
+        status, _, _ = prebuild.warm(obj, 80, 24, 2, 0.5, "wireframe", False, True)
+        self.assertEqual(status, "built")
+
+    def test_several_sizes_write_variant_caches(self):
+        code, out = self.run_main(self.root / "sub", "--size", "80x24", "--size", "100x30",
+                                  "--frames", "2", "--jobs", "1")
+        self.assertEqual(code, 0)
+        self.assertIn("2 built, 0 skipped, 0 failed", out)
+        obj = str(self.root / "sub" / "c.obj")
+        for cols, rows in ((80, 24), (100, 30)):
+            self.assertTrue(Path(variant_cache_path(obj, cols, rows, 2, "wireframe", 0.5)).exists())
+        self.assertFalse(Path(f"{obj}.cache.json").exists())
+
+        code, out = self.run_main(self.root / "sub", "--size", "80x24", "--size", "100x30",
+                                  "--frames", "2", "--jobs", "1")
+        self.assertIn("0 built, 2 skipped, 0 failed", out)
+
+    def test_variants_differ_by_mode_and_aspect(self):
+        obj = str(self.root / "b.obj")
+        paths = {variant_cache_path(obj, 80, 24, 2, mode, aspect)
+                 for mode in ("wireframe", "solid") for aspect in (0.5, 0.45)}
+        self.assertEqual(len(paths), 4)
+        prebuild.warm(obj, 80, 24, 2, 0.5, "solid", True, False)
+        status, _, _ = prebuild.warm(obj, 80, 24, 2, 0.5, "wireframe", True, False)
+        self.assertEqual(status, "built")
+        self.assertTrue(Path(variant_cache_path(obj, 80, 24, 2, "solid", 0.5)).exists())
+
+    def test_missing_path_fails(self):
+        code, out = self.run_main(self.root / "missing")
+        self.assertEqual(code, 1)
+        self.assertIn("not found", out)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "examples", "snake"))
+from snakesim import (  # noqa: E402
+    DOWN,
+    NOOP,
+    OBS_SIZE,
+    REWARD_DEATH,
+    RIGHT,
+    UP,
+    SnakeBatch,
+    replay,
+)
+
+
+class SnakeBatchTests(unittest.TestCase):
+    def test_initial_state_matches_front_end(self):
+        sim = SnakeBatch(2, grid_w=20, grid_h=12)
+        snap = sim.snapshot(0)
+        self.assertEqual(snap["body"], [(8, 6), (9, 6), (10, 6)])
+        self.assertTrue(snap["alive"])
+        self.assertEqual(len(sim.observe()), 2 * OBS_SIZE)
+
+    def test_wall_collision_ends_game(self):
+        sim = SnakeBatch(1, grid_w=8, grid_h=3)
+        death_rewards = []
+        for _ in range(8):
+            _, rewards, dones = sim.step([RIGHT])
+            if dones[0]:
+                death_rewards.append(rewards[0])
+        self.assertEqual(death_rewards, [REWARD_DEATH])
+        self.assertFalse(sim.snapshot(0)["alive"])
+
+    def test_reversal_is_ignored(self):
+        sim = SnakeBatch(1, grid_w=20, grid_h=12)
+        sim.step([UP])
+        sim.step([DOWN])  # would reverse into the neck
+        self.assertTrue(sim.snapshot(0)["alive"])
+        self.assertEqual(sim.snapshot(0)["body"][-1], (10, 4))
+
+    def test_same_seed_is_deterministic(self):
+        rng = random.Random(3)
+        plan = [[rng.randrange(5) for _ in range(16)] for _ in range(120)]
+        a = SnakeBatch(16, seed=7)
+        b = SnakeBatch(16, seed=7)
+        for actions in plan:
+            a.step(actions)
+            b.step(actions)
+        self.assertEqual([a.snapshot(i) for i in range(16)], [b.snapshot(i) for i in range(16)])
+
+    def test_replay_reproduces_episode(self):
+        rng = random.Random(1)
+        sim = SnakeBatch(8, grid_w=10, grid_h=8, seed=5, record=True)
+        for _ in range(200):
+            sim.step([rng.choice((NOOP, NOOP, 1, 2, 3, 4)) for _ in range(8)])
+        for i in range(8):
+            frames = list(replay(sim.episode(i)))
+            self.assertEqual(frames[-1], sim.snapshot(i))
+
+
+if __name__ == "__main__":
+    unittest.main()